@@ -1,7 +1,7 @@
 """
 Movie Finder - IMDb Movie Information Scraper & Local Database Viewer
 
-A desktop application that allows users to search for movies in a local JSON database.
+A desktop application that allows users to search for movies in a local SQLite database.
 If a movie is not found, it scrapes movie information from IMDb and saves it to the database.
 
 Features:
@@ -12,7 +12,7 @@ Features:
 - Automatic database persistence
 
 Requirements:
-    pip install selenium beautifulsoup4 tk
+    pip install httpx[http2] selectolax msgspec tk
 
 Author: Movie Finder
 License: MIT
@@ -20,10 +20,19 @@ License: MIT
 
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-import json
+import atexit
+import importlib.util
 import os
+import sqlite3
 import sys
-from typing import Tuple, Optional, Dict, List
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from urllib.parse import quote
+from typing import Tuple, Optional, Dict, List, Iterator, Callable, Union, Set, DefaultDict
+
+import msgspec
 
 
 # ============================================================================
@@ -46,48 +55,292 @@ def resource_path(relative: str) -> str:
 
 
 DB_FILE = resource_path("all_movies.json")
+SQLITE_FILE = DB_FILE.replace(".json", ".sqlite")
+
+# IMDb's search-as-you-type endpoint; returns id, title and year as JSON
+SUGGESTION_URL = "https://v3.sg.media-imdb.com/suggestion/x/{query}.json"
+
+# Title pages are only served in full to browser-like clients
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# data-testid -> tag name of the single-element fields on a title page
+TITLE_PAGE_FIELDS = {
+    "hero-title-block__title": "h1",
+    "title-details-releasedate": "a",
+    "hero-rating-bar__aggregate-rating__score": "span",
+    "genres": "div",
+    "title-details-certificate": "span",
+    "plot-l": "span",
+    "plot-xl": "span",
+}
+
+# Seconds to wait for IMDb to connect / respond before giving up
+CONNECT_TIMEOUT = 5.0
+REQUEST_TIMEOUT = 10.0
+
+# Shared by the UI thread (lookups) and worker threads (saves); guarded by _db_lock
+_conn = sqlite3.connect(SQLITE_FILE, check_same_thread=False)
+_db_lock = threading.Lock()
+
+# Decoded movies by lowercased title, valid while the SQLite file's mtime
+# matches _cache_mtime
+_cache_mtime: Optional[int] = None
+_movie_cache: Dict[str, "Movie"] = {}
+
+# Fuzzy title search: trigram -> lowercased titles containing it, and each
+# title's own trigram set. Also guarded by _db_lock.
+FUZZY_MATCH_THRESHOLD = 0.6
+LEADING_ARTICLES = ("the ", "a ", "an ")
+_trigram_index: DefaultDict[str, Set[str]] = defaultdict(set)
+_title_trigrams: Dict[str, Set[str]] = {}
+
+
+# ============================================================================
+# DATA MODEL
+# ============================================================================
+
+class Movie(msgspec.Struct):
+    """
+    Movie information as stored in the database and shown in the UI.
+    
+    Decoding a stored record straight into this struct validates and parses
+    it in one pass; unknown keys from older records are ignored.
+    """
+    title: str
+    year: Union[str, int] = "N/A"
+    rating: Union[str, float] = "N/A"
+    genres: List[str] = []
+    directors: List[str] = []
+    writers: List[str] = []
+    cast: List[str] = []
+    certificate: str = "N/A"
+    description: str = "N/A"
 
 
 # ============================================================================
 # DATABASE FUNCTIONS
 # ============================================================================
 
-def load_db() -> Dict:
+def iter_legacy_db() -> Iterator[Tuple[str, Dict]]:
+    """
+    Stream movies from the legacy JSON database.
+    
+    Only used to migrate an existing all_movies.json into SQLite. Uses ijson
+    when installed so only one movie is held in memory at a time, and falls
+    back to parsing the whole file with msgspec otherwise.
+    
+    Yields:
+        Tuple[str, Dict]: (key, movie_data) for each movie in the file
+    """
+    if not os.path.exists(DB_FILE):
+        return
+    
+    try:
+        import ijson
+    except ImportError:
+        with open(DB_FILE, "rb") as f:
+            data = f.read()
+        yield from msgspec.json.decode(data).items()
+        return
+    
+    with open(DB_FILE, "rb") as f:
+        yield from ijson.kvitems(f, "", use_float=True)
+
+
+def _encode_movie(movie: Union[Movie, Dict]) -> str:
+    """Serialize a movie record as compact JSON for storage."""
+    return msgspec.json.encode(movie).decode("utf-8")
+
+
+def init_db() -> None:
+    """
+    Create the SQLite movies table and migrate the legacy JSON database.
+    
+    Movies are keyed by their lowercased title so a search is a single
+    primary-key lookup. The legacy JSON file is imported in one transaction
+    the first time the table is found empty. Finally the trigram index used
+    for fuzzy title search is built from the stored titles.
+    """
+    _conn.execute(
+        "CREATE TABLE IF NOT EXISTS movies (title_lower TEXT PRIMARY KEY, data JSON)"
+    )
+    _conn.commit()
+    
+    if _conn.execute("SELECT 1 FROM movies LIMIT 1").fetchone() is None:
+        _migrate_legacy_db()
+    
+    for (title_lower,) in _conn.execute("SELECT title_lower FROM movies"):
+        _index_title(title_lower)
+
+
+def _migrate_legacy_db() -> None:
+    """Import all_movies.json into the (empty) movies table in one transaction."""
+    # INSERT OR IGNORE keeps the first movie for duplicate titles, matching
+    # the first-match behaviour of the old linear search
+    rows = (
+        (movie.get("title", "").lower(), _encode_movie(movie))
+        for _, movie in iter_legacy_db()
+    )
+    try:
+        with _conn:
+            _conn.executemany("INSERT OR IGNORE INTO movies VALUES (?, ?)", rows)
+    except Exception as e:
+        print(f"Error migrating database: {e}")
+
+
+def _trigrams(text: str) -> Set[str]:
+    """
+    Return the set of 3-character substrings of a padded, lowercased title.
+    
+    A leading article is dropped first so "The Dark Knight" and "dark knight"
+    produce the same trigrams.
+    """
+    text = text.lower().strip()
+    for article in LEADING_ARTICLES:
+        if text.startswith(article):
+            text = text[len(article):]
+            break
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _index_title(title_lower: str) -> None:
+    """Add a stored title to the trigram index."""
+    grams = _trigrams(title_lower)
+    _title_trigrams[title_lower] = grams
+    for gram in grams:
+        _trigram_index[gram].add(title_lower)
+
+
+def _db_mtime() -> Optional[int]:
+    """Return the SQLite file's mtime in nanoseconds, or None if unavailable."""
+    try:
+        return os.stat(SQLITE_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+def find_movie(name: str) -> Optional[Movie]:
     """
-    Load movies from local JSON database.
+    Look up a movie in the local database by title (case-insensitive).
     
+    Decoded movies are cached in memory and reused while the database file
+    is unchanged, so repeat searches skip the query and JSON decoding.
+    
+    Args:
+        name (str): Movie title to look up
+        
     Returns:
-        Dict: Dictionary of movies, or empty dict if DB doesn't exist
+        Movie | None: Movie information, or None if not in database
     """
-    if os.path.exists(DB_FILE):
+    global _cache_mtime
+    
+    title_lower = name.lower()
+    with _db_lock:
+        mtime = _db_mtime()
+        if mtime != _cache_mtime:
+            _movie_cache.clear()
+            _cache_mtime = mtime
+        elif title_lower in _movie_cache:
+            return _movie_cache[title_lower]
+        
+        try:
+            row = _conn.execute(
+                "SELECT data FROM movies WHERE title_lower = ?", (title_lower,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading database: {e}")
+            return None
+        if row is None:
+            return None
+        
         try:
-            with open(DB_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading database: {e}")
-            return {}
-    return {}
+            movie = msgspec.json.decode(row[0], type=Movie)
+        except msgspec.ValidationError as e:
+            print(f"Error reading database: {e}")
+            return None
+        _movie_cache[title_lower] = movie
+        return movie
 
 
-def save_db(db: Dict) -> None:
+def save_movie(movie: Movie) -> None:
     """
-    Save movies to local JSON database.
+    Insert or replace a single movie in the local database.
+    
+    Safe to call from a worker thread.
     
     Args:
-        db (Dict): Dictionary of movies to save
+        movie (Movie): Movie information to store, keyed by its title
+        
+    Raises:
+        sqlite3.Error: If the movie could not be written
     """
-    try:
-        with open(DB_FILE, "w", encoding="utf-8") as f:
-            json.dump(db, f, indent=2, ensure_ascii=False)
-    except IOError as e:
-        messagebox.showerror("Save Error", f"Failed to save database: {str(e)}")
+    global _cache_mtime
+    
+    title_lower = movie.title.lower()
+    with _db_lock:
+        # Drop the cache if another writer touched the file since we last looked
+        if _db_mtime() != _cache_mtime:
+            _movie_cache.clear()
+        
+        with _conn:
+            _conn.execute(
+                "INSERT OR REPLACE INTO movies VALUES (?, ?)",
+                (title_lower, _encode_movie(movie))
+            )
+        
+        # Our own write changes the mtime; keep the cache valid instead of re-reading
+        _cache_mtime = _db_mtime()
+        _movie_cache[title_lower] = movie
+        _index_title(title_lower)
+
+
+def find_similar_movie(name: str) -> Optional[Movie]:
+    """
+    Look up the stored movie whose title best matches a misspelled query.
+    
+    Candidate titles are those sharing at least one trigram with the query;
+    they are ranked by the Dice coefficient of their trigram sets, and the
+    best one is returned if it scores above FUZZY_MATCH_THRESHOLD. The result
+    is only a suggestion: sequels and remakes score highly against each other,
+    so callers must confirm it with the user.
+    
+    Args:
+        name (str): Movie title to look up
+        
+    Returns:
+        Movie | None: Closest movie, or None if nothing is similar enough
+    """
+    query_grams = _trigrams(name)
+    
+    with _db_lock:
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in query_grams:
+            for title_lower in _trigram_index.get(gram, ()):
+                shared[title_lower] += 1
+        
+        best_title, best_score = None, 0.0
+        for title_lower, overlap in shared.items():
+            score = 2 * overlap / (len(query_grams) + len(_title_trigrams[title_lower]))
+            if score > best_score:
+                best_title, best_score = title_lower, score
+    
+    if best_title is None or best_score <= FUZZY_MATCH_THRESHOLD:
+        return None
+    return find_movie(best_title)
 
 
 # ============================================================================
 # UI DISPLAY FUNCTIONS
 # ============================================================================
 
-def display_movie_details(movie_data: Dict, movie_title: str) -> None:
+def display_movie_details(movie: Movie, movie_title: str) -> None:
     """
     Display interactive movie information menu.
     
@@ -95,297 +348,413 @@ def display_movie_details(movie_data: Dict, movie_title: str) -> None:
     Loops until user chooses to go back.
     
     Args:
-        movie_data (Dict): Movie information dictionary with keys:
-                           title, year, rating, genres, directors, writers, 
-                           cast, certificate, description
+        movie (Movie): Movie information to display
         movie_title (str): Display title of the movie
     """
+    # Build every page once; the menu loop below only looks them up
+    genres = ', '.join(movie.genres or ['N/A'])
+    directors = ', '.join(movie.directors or ['N/A'])
+    writers = ', '.join(movie.writers or ['N/A'])
+    cast = ', '.join(movie.cast or ['N/A'])
+    stars = ', '.join(movie.cast[:5] or ['N/A'])
+    
+    pages = {
+        1: ("Title & Year", f"Title: {movie.title}\nYear: {movie.year}"),
+        2: ("Rating & Certificate", f"IMDb Rating: {movie.rating}\nCertificate: {movie.certificate}"),
+        3: ("Genres", f"Genres: {genres}"),
+        4: ("Directors", f"Directors:\n{directors}"),
+        5: ("Writers", f"Writers:\n{writers}"),
+        6: ("Cast", f"Cast (Top 10):\n{cast}"),
+        7: ("Plot/Description", f"Plot:\n{movie.description}"),
+        8: ("Full Movie Information", (
+            f"Title: {movie.title} ({movie.year})\n"
+            f"IMDb Rating: {movie.rating}\n"
+            f"Genres: {genres}\n"
+            f"Directors: {directors}\n"
+            f"Writers: {writers}\n"
+            f"Stars: {stars}\n"
+            f"Certificate: {movie.certificate}\n"
+            f"\nPlot: {movie.description}\n"
+        )),
+    }
+    
+    menu_text = f"Movie: {movie_title}\n\n"
+    menu_text += "What information do you want to see?\n\n"
+    menu_text += "1. Title & Year\n"
+    menu_text += "2. IMDb Rating & Certificate\n"
+    menu_text += "3. Genres\n"
+    menu_text += "4. Directors\n"
+    menu_text += "5. Writers\n"
+    menu_text += "6. Cast\n"
+    menu_text += "7. Plot/Description\n"
+    menu_text += "8. Full Information (All)\n"
+    menu_text += "0. Back to Search\n\n"
+    menu_text += "Enter your choice (0-8):"
+    
     while True:
-        menu_text = f"Movie: {movie_title}\n\n"
-        menu_text += "What information do you want to see?\n\n"
-        menu_text += "1. Title & Year\n"
-        menu_text += "2. IMDb Rating & Certificate\n"
-        menu_text += "3. Genres\n"
-        menu_text += "4. Directors\n"
-        menu_text += "5. Writers\n"
-        menu_text += "6. Cast\n"
-        menu_text += "7. Plot/Description\n"
-        menu_text += "8. Full Information (All)\n"
-        menu_text += "0. Back to Search\n\n"
-        menu_text += "Enter your choice (0-8):"
-        
-        root = tk.Tk()
-        root.withdraw()
-        
         choice = simpledialog.askinteger(
             "Movie Details",
             menu_text,
             minvalue=0,
             maxvalue=8,
-            parent=root
+            parent=root_window
         )
-        root.destroy()
         
         if choice is None or choice == 0:
             break
         
         # Display selected information
-        if choice == 1:
-            response = (
-                f"Title: {movie_data['title']}\n"
-                f"Year: {movie_data.get('year', 'N/A')}"
-            )
-            messagebox.showinfo("Title & Year", response)
-        
-        elif choice == 2:
-            response = (
-                f"IMDb Rating: {movie_data.get('rating', 'N/A')}\n"
-                f"Certificate: {movie_data.get('certificate', 'N/A')}"
-            )
-            messagebox.showinfo("Rating & Certificate", response)
-        
-        elif choice == 3:
-            genres = ', '.join(movie_data.get('genres', [])) if movie_data.get('genres') else 'N/A'
-            response = f"Genres: {genres}"
-            messagebox.showinfo("Genres", response)
-        
-        elif choice == 4:
-            directors = ', '.join(movie_data.get('directors', [])) if movie_data.get('directors') else 'N/A'
-            response = f"Directors:\n{directors}"
-            messagebox.showinfo("Directors", response)
-        
-        elif choice == 5:
-            writers = ', '.join(movie_data.get('writers', [])) if movie_data.get('writers') else 'N/A'
-            response = f"Writers:\n{writers}"
-            messagebox.showinfo("Writers", response)
-        
-        elif choice == 6:
-            cast = ', '.join(movie_data.get('cast', [])) if movie_data.get('cast') else 'N/A'
-            response = f"Cast (Top 10):\n{cast}"
-            messagebox.showinfo("Cast", response)
-        
-        elif choice == 7:
-            description = movie_data.get('description', 'N/A')
-            messagebox.showinfo("Plot/Description", f"Plot:\n{description}")
-        
-        elif choice == 8:
-            response = (
-                f"Title: {movie_data['title']} ({movie_data.get('year', 'N/A')})\n"
-                f"IMDb Rating: {movie_data.get('rating', 'N/A')}\n"
-                f"Genres: {', '.join(movie_data.get('genres', []) or ['N/A'])}\n"
-                f"Directors: {', '.join(movie_data.get('directors', []) or ['N/A'])}\n"
-                f"Writers: {', '.join(movie_data.get('writers', []) or ['N/A'])}\n"
-                f"Stars: {', '.join(movie_data.get('cast', [])[:5] or ['N/A'])}\n"
-                f"Certificate: {movie_data.get('certificate', 'N/A')}\n"
-                f"\nPlot: {movie_data.get('description', '')}\n"
-            )
-            messagebox.showinfo("Full Movie Information", response)
+        messagebox.showinfo(*pages[choice])
 
 
 # ============================================================================
 # WEB SCRAPING FUNCTIONS
 # ============================================================================
 
-def scrape_imdb(movie_name: str) -> Tuple[Optional[Dict], Optional[str]]:
+# Network and database work runs here so the Tk main loop never blocks
+_pool = ThreadPoolExecutor(max_workers=2)
+
+_client = None
+_client_lock = threading.Lock()
+
+# Movies scraped this session, keyed by the lowercased query that found them.
+# Lets a repeated query that doesn't match the stored title skip IMDb.
+SCRAPE_CACHE_SIZE = 100
+_scrape_cache: "OrderedDict[str, Movie]" = OrderedDict()
+
+
+def _get_client():
+    """
+    Return the shared HTTP client, creating it on first use.
+    
+    Keeping one client for the whole session lets later scrapes reuse open
+    connections to IMDb instead of repeating the TCP and TLS handshakes.
+    The client is closed when the interpreter exits.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            import httpx
+            _client = httpx.Client(
+                http2=True,
+                headers=HTTP_HEADERS,
+                follow_redirects=True,
+                timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+            )
+            atexit.register(_client.close)
+    return _client
+
+
+def run_in_background(func: Callable, *args, on_done: Callable[[Future], None]) -> None:
     """
-    Search IMDb for a movie and scrape its details.
+    Run func(*args) on the worker pool and hand its future to on_done.
+    
+    on_done is scheduled with root_window.after() so it always runs on the
+    Tk main thread, which is the only thread allowed to touch widgets.
+    
+    Args:
+        func (Callable): Blocking function to run off the main thread
+        on_done (Callable): Main-thread callback receiving the finished future
+    """
+    future = _pool.submit(func, *args)
+    future.add_done_callback(lambda f: root_window.after(0, on_done, f))
+
+
+def scrape_imdb(movie_name: str) -> None:
+    """
+    Search IMDb for a movie and scrape its details without blocking the UI.
     
     Workflow:
-    1. Opens IMDb homepage
-    2. Searches for the movie
-    3. Shows top 10 results to user
-    4. User selects the correct movie
-    5. Scrapes detailed movie information from selected movie page
-    6. Returns structured movie data
+    1. Queries IMDb's search suggestion endpoint for the movie (worker thread)
+    2. Shows top 10 results to user, prefetching the first one's page when
+       it is the only result or matches the query exactly
+    3. User selects the correct movie
+    4. Fetches, scrapes and saves the selected movie page (worker thread)
+    5. Displays the new movie's details
     
     Args:
         movie_name (str): Name of movie to search for
-        
-    Returns:
-        Tuple[Dict | None, str | None]: (movie_data, selected_title) or (None, None) if cancelled
     """
-    try:
-        from selenium import webdriver
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.keys import Keys
-        import time
-        from bs4 import BeautifulSoup
-        
-    except ImportError as e:
+    # h2 is needed for the http2=True client but only imported lazily by httpx
+    missing = [
+        module for module in ("httpx", "h2", "selectolax")
+        if importlib.util.find_spec(module) is None
+    ]
+    if missing:
         messagebox.showerror(
             "Missing Library",
-            f"Missing library: {str(e)}\n\nInstall with:\n"
-            "pip install selenium beautifulsoup4"
+            f"Missing library: {', '.join(missing)}\n\nInstall with:\n"
+            "pip install httpx[http2] selectolax"
         )
-        return None, None
+        return
     
-    driver = webdriver.Chrome()
+    # Re-enabled by the callbacks once the scrape finishes, fails or is cancelled
+    set_search_enabled(False)
+    run_in_background(search_imdb, movie_name, on_done=partial(_on_search_results, movie_name))
+
+
+def search_imdb(movie_name: str) -> List[Dict]:
+    """
+    Query IMDb search suggestions for a movie. Runs on a worker thread.
     
-    try:
-        # Step 1: Open IMDb and search
-        driver.get("https://www.imdb.com/")
-        
-        search_box = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "suggestion-search"))
-        )
-        
-        search_box.clear()
-        search_box.send_keys(movie_name)
-        search_box.send_keys(Keys.RETURN)
-        
-        time.sleep(3)
-        
-        # Step 2: Parse search results
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        results = []
-        result_links = soup.find_all('a', {'data-testid': 'find-result-title-link'})
-        
-        if not result_links:
-            result_links = soup.find_all('a', href=lambda x: x and '/title/tt' in x)
-        
-        for idx, link in enumerate(result_links[:10]):
-            title_text = link.text.strip()
-            href = link.get('href', '')
-            
-            year = "N/A"
-            if '(' in title_text and ')' in title_text:
-                try:
-                    year = title_text.split('(')[-1].replace(')', '')
-                except:
-                    pass
-            
-            results.append({
-                'index': idx + 1,
-                'title': title_text,
-                'year': year,
-                'href': href if href.startswith('http') else f"https://www.imdb.com{href}",
-                'id': href.split('/title/')[1].split('/')[0] if '/title/' in href else None
-            })
+    Args:
+        movie_name (str): Name of movie to search for
         
-        if not results:
-            driver.quit()
-            messagebox.showerror("No Results", "No search results found on IMDb.")
-            return None, None
+    Returns:
+        List[Dict]: Up to 10 results with keys: index, title, year, href, id
+    """
+    response = _get_client().get(SUGGESTION_URL.format(query=quote(movie_name, safe="")))
+    response.raise_for_status()
+    
+    results = []
+    suggestions = [
+        s for s in response.json().get('d', [])
+        if s.get('id', '').startswith('tt')
+    ]
+    
+    for idx, suggestion in enumerate(suggestions[:10]):
+        results.append({
+            'index': idx + 1,
+            'title': suggestion.get('l', 'N/A'),
+            'year': str(suggestion.get('y', 'N/A')),
+            'href': f"https://www.imdb.com/title/{suggestion['id']}/",
+            'id': suggestion['id']
+        })
+    
+    return results
+
+
+def download_page(url: str) -> str:
+    """
+    Download an IMDb page's HTML. Runs on a worker thread.
+    
+    Args:
+        url (str): Page URL
         
-        # Step 3: Present selection dialog
-        selection_text = "Found multiple results. Please select the correct movie:\n\n"
-        for result in results:
-            selection_text += f"{result['index']}. {result['title']} ({result['year']})\n"
-        selection_text += f"\nEnter number (1-{len(results)}) or 0 to cancel:"
+    Returns:
+        str: Response body
+    """
+    response = _get_client().get(url)
+    response.raise_for_status()
+    return response.text
+
+
+def fetch_movie(selected_movie: Dict, page: Optional[Future] = None) -> Tuple[Movie, str]:
+    """
+    Scrape the selected movie's IMDb page and save it. Runs on a worker thread.
+    
+    Args:
+        selected_movie (Dict): Search result chosen by the user
+        page (Future, optional): Finished download_page() of the movie page,
+                                 if it was prefetched
         
-        root = tk.Tk()
-        root.withdraw()
+    Returns:
+        Tuple[Movie, str]: (movie, selected_title)
+    """
+    from selectolax.lexbor import LexborHTMLParser
+    
+    html = page.result() if page is not None else download_page(selected_movie['href'])
+    
+    # Scrape movie details (robust selectors)
+    movie_tree = LexborHTMLParser(html)
+    
+    movie = _extract_movie_data(movie_tree, selected_movie)
+    
+    save_movie(movie)
+    
+    return movie, selected_movie['title']
+
+
+def _recall_scrape(movie_name: str) -> Optional[Movie]:
+    """
+    Return the movie a previous scrape for this query produced, if any.
+    
+    Args:
+        movie_name (str): Search query (case-insensitive)
         
-        user_choice = simpledialog.askinteger(
-            "Movie Selection",
-            selection_text,
-            minvalue=0,
-            maxvalue=len(results),
-            parent=root
+    Returns:
+        Movie | None: Cached movie information, or None
+    """
+    query = movie_name.lower()
+    movie = _scrape_cache.get(query)
+    if movie is not None:
+        _scrape_cache.move_to_end(query)
+    return movie
+
+
+def _remember_scrape(movie_name: str, movie: Movie) -> None:
+    """Cache a scraped movie under its query, evicting the least recently used."""
+    _scrape_cache[movie_name.lower()] = movie
+    _scrape_cache.move_to_end(movie_name.lower())
+    if len(_scrape_cache) > SCRAPE_CACHE_SIZE:
+        _scrape_cache.popitem(last=False)
+
+
+def _on_search_results(movie_name: str, future: Future) -> None:
+    """Let the user pick a search result, then fetch it in the background."""
+    try:
+        results = future.result()
+    except Exception as e:
+        set_search_enabled(True)
+        _show_scrape_error(e)
+        return
+    
+    if not results:
+        set_search_enabled(True)
+        messagebox.showerror("No Results", "No search results found on IMDb.")
+        return
+    
+    # When the top result is almost certainly the pick (the only result, or an
+    # exact title match), download it while the user is choosing. Otherwise
+    # don't spend a title-page request on a guess.
+    prefetch = None
+    if len(results) == 1 or results[0]['title'].lower() == movie_name.lower():
+        prefetch = _pool.submit(download_page, results[0]['href'])
+    
+    # Present selection dialog
+    selection_text = "Found multiple results. Please select the correct movie:\n\n"
+    for result in results:
+        selection_text += f"{result['index']}. {result['title']} ({result['year']})\n"
+    selection_text += f"\nEnter number (1-{len(results)}) or 0 to cancel:"
+    
+    user_choice = simpledialog.askinteger(
+        "Movie Selection",
+        selection_text,
+        minvalue=0,
+        maxvalue=len(results),
+        parent=root_window
+    )
+    
+    if user_choice is None or user_choice == 0:
+        set_search_enabled(True)
+        return
+    
+    selected_movie = results[user_choice - 1]
+    on_done = partial(_on_movie_fetched, movie_name)
+    
+    if user_choice == 1 and prefetch is not None:
+        # Chain on the prefetch instead of waiting for it inside a worker
+        prefetch.add_done_callback(
+            lambda page: run_in_background(fetch_movie, selected_movie, page, on_done=on_done)
         )
-        root.destroy()
-        
-        if user_choice is None or user_choice == 0:
-            driver.quit()
-            return None, None
-        
-        # Step 4: Navigate to selected movie
-        selected_movie = results[user_choice - 1]
-        selected_title = selected_movie['title']
-        movie_url = selected_movie['href']
-        
-        driver.get(movie_url)
-        time.sleep(2)
-        
-        # Step 5: Scrape movie details (robust selectors)
-        movie_soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        movie_data = _extract_movie_data(movie_soup, selected_movie)
-        
-        driver.quit()
-        
-        return movie_data, selected_title
+    else:
+        run_in_background(fetch_movie, selected_movie, on_done=on_done)
+
+
+def _on_movie_fetched(movie_name: str, future: Future) -> None:
+    """Announce and display a freshly scraped movie."""
+    set_search_enabled(True)
     
+    try:
+        movie, selected_title = future.result()
     except Exception as e:
-        driver.quit()
-        messagebox.showerror("Error", f"Error during scraping: {str(e)}")
-        return None, None
+        _show_scrape_error(e)
+        return
+    
+    _remember_scrape(movie_name, movie)
+    
+    messagebox.showinfo(
+        "Movie Added",
+        f"Successfully added '{movie.title}' to database!"
+    )
+    display_movie_details(movie, selected_title)
+
 
+def _show_scrape_error(error: Exception) -> None:
+    """Report an exception raised by a background scraping task."""
+    import httpx
+    
+    if isinstance(error, httpx.TimeoutException):
+        messagebox.showerror("Timeout", "IMDb did not respond in time. Please try again.")
+    elif isinstance(error, sqlite3.Error):
+        messagebox.showerror("Save Error", f"Failed to save database: {str(error)}")
+    else:
+        messagebox.showerror("Error", f"Error during scraping: {str(error)}")
 
-def _extract_movie_data(soup, fallback_data: Dict) -> Dict:
+
+def _extract_movie_data(tree, fallback_data: Dict) -> Movie:
     """
     Extract movie details from IMDb movie page HTML using robust selectors.
     
     Uses data-testid attributes (more stable than class names) with fallbacks
-    for fields that may change structure.
+    for fields that may change structure. All data-testid elements are
+    collected in a single walk of the tree rather than one search per field,
+    and the fallbacks use CSS attribute selectors matched in selectolax's C
+    engine instead of Python callbacks.
     
     Args:
-        soup: BeautifulSoup parsed HTML
+        tree: selectolax LexborHTMLParser of the movie page
         fallback_data (Dict): Fallback info from search results
         
     Returns:
-        Dict: Movie information with keys: title, year, rating, genres, 
-              directors, writers, cast, certificate, description
+        Movie: Movie information scraped from the page
     """
     
+    # Walk every data-testid element once, keeping the first match per field
+    tagged = {}
+    credits = []
+    cast_items = []
+    for element in tree.css('[data-testid]'):
+        testid = element.attributes['data-testid']
+        if testid == 'title-pc-principal-credit' and element.tag == 'li':
+            credits.append(element)
+        elif testid == 'title-cast-item' and element.tag == 'div':
+            cast_items.append(element)
+        elif TITLE_PAGE_FIELDS.get(testid) == element.tag:
+            tagged.setdefault(testid, element)
+    
     # Title
-    title_tag = soup.find('h1', {'data-testid': 'hero-title-block__title'})
-    title = title_tag.text.strip() if title_tag else fallback_data.get('title', 'N/A')
+    title_tag = tagged.get('hero-title-block__title')
+    title = title_tag.text().strip() if title_tag is not None else fallback_data.get('title', 'N/A')
     
     # Year
     year = "N/A"
-    year_tag = soup.find('a', {'data-testid': 'title-details-releasedate'})
-    if year_tag:
-        year_text = year_tag.text.strip()
+    year_tag = tagged.get('title-details-releasedate')
+    if year_tag is not None:
+        year_text = year_tag.text().strip()
         if year_text:
             year = year_text.split()[-1]
     
     # IMDb Rating (primary and fallback selectors)
     rating = "N/A"
-    rating_tag = soup.find('span', {'data-testid': 'hero-rating-bar__aggregate-rating__score'})
-    if rating_tag and rating_tag.text:
-        rating = rating_tag.text.strip().split('/')[0]
+    rating_tag = tagged.get('hero-rating-bar__aggregate-rating__score')
+    if rating_tag is not None and rating_tag.text():
+        rating = rating_tag.text().strip().split('/')[0]
     if rating == "N/A":
-        alt_rating_tag = soup.find('span', class_=lambda x: x and "AggregateRatingButton__RatingScore" in x)
-        if alt_rating_tag and alt_rating_tag.text:
-            rating = alt_rating_tag.text.strip()
+        alt_rating_tag = tree.css_first('span[class*="AggregateRatingButton__RatingScore"]')
+        if alt_rating_tag is not None and alt_rating_tag.text():
+            rating = alt_rating_tag.text().strip()
     
     # Genres (with fallback)
     genres = []
-    genre_section = soup.find('div', {'data-testid': 'genres'})
-    if genre_section:
-        genre_spans = genre_section.find_all('span', {'class': 'ipc-chip__text'})
-        genres = [span.text.strip() for span in genre_spans]
+    genre_section = tagged.get('genres')
+    if genre_section is not None:
+        genre_spans = genre_section.css('span.ipc-chip__text')
+        genres = [span.text().strip() for span in genre_spans]
     if not genres:
-        genre_links = soup.find_all('a', href=lambda x: x and '/search/title?genres=' in x)
-        genres = [g.text.strip() for g in genre_links]
+        genre_links = tree.css('a[href*="/search/title?genres="]')
+        genres = [g.text().strip() for g in genre_links]
     
     # Certificate
     certificate = "N/A"
-    certificate_tag = soup.find('span', {'data-testid': 'title-details-certificate'})
-    if certificate_tag:
-        certificate = certificate_tag.text.strip()
+    certificate_tag = tagged.get('title-details-certificate')
+    if certificate_tag is not None:
+        certificate = certificate_tag.text().strip()
     
     # Plot/Description
     description = "N/A"
-    plot_tag = soup.find('span', {'data-testid': 'plot-l'})
-    if not plot_tag:
-        plot_tag = soup.find('span', {'data-testid': 'plot-xl'})
-    if plot_tag:
-        description = plot_tag.text.strip()
+    plot_tag = tagged.get('plot-l', tagged.get('plot-xl'))
+    if plot_tag is not None:
+        description = plot_tag.text().strip()
     
     # Directors and Writers
     directors = []
     writers = []
-    credits = soup.find_all('li', {'data-testid': 'title-pc-principal-credit'})
     for credit in credits:
-        label = credit.find('span', {'class': 'ipc-metadata-list-item__label'})
-        if label:
-            label_text = label.text.strip()
-            names = [a.text.strip() for a in credit.find_all('a')]
+        label = credit.css_first('span.ipc-metadata-list-item__label')
+        if label is not None:
+            label_text = label.text().strip()
+            names = [a.text().strip() for a in credit.css('a')]
             if 'Director' in label_text:
                 directors = names
             elif 'Writer' in label_text:
@@ -393,38 +762,55 @@ def _extract_movie_data(soup, fallback_data: Dict) -> Dict:
     
     # Cast (top 10)
     cast = []
-    cast_items = soup.find_all('div', {'data-testid': 'title-cast-item'})
     for item in cast_items[:10]:
-        actor_tag = item.find('a', {'data-testid': 'title-cast-item__actor'})
-        if actor_tag:
-            cast.append(actor_tag.text.strip())
-    
-    return {
-        "title": title,
-        "year": year,
-        "rating": rating,
-        "genres": genres,
-        "directors": directors,
-        "writers": writers,
-        "cast": cast,
-        "certificate": certificate,
-        "description": description
-    }
+        actor_tag = item.css_first('a[data-testid="title-cast-item__actor"]')
+        if actor_tag is not None:
+            cast.append(actor_tag.text().strip())
+    
+    return Movie(
+        title=title,
+        year=year,
+        rating=rating,
+        genres=genres,
+        directors=directors,
+        writers=writers,
+        cast=cast,
+        certificate=certificate,
+        description=description
+    )
 
 
 # ============================================================================
 # SEARCH & MAIN LOGIC
 # ============================================================================
 
+def set_search_enabled(enabled: bool) -> None:
+    """
+    Enable or disable the Search button and the Enter key binding.
+    
+    Used to block new searches while an IMDb scrape is in flight.
+    
+    Args:
+        enabled (bool): Whether searching should be possible
+    """
+    search_button.config(state=tk.NORMAL if enabled else tk.DISABLED)
+    if enabled:
+        entry.bind("<Return>", lambda event: search_movie())
+    else:
+        entry.unbind("<Return>")
+
+
 def search_movie() -> None:
     """
     Main search handler - queries local DB first, then IMDb if not found.
     
     Workflow:
     1. Get user input from search entry
-    2. Check local database
+    2. Check local database, then queries already scraped this session
     3. If found: display details
-    4. If not found: scrape IMDb, save to DB, display details
+    4. Otherwise offer the closest stored title, if any, as a suggestion
+    5. If there is none or the user declines: scrape IMDb in the background,
+       save to DB, display details
     """
     name = entry.get().strip()
     
@@ -432,39 +818,26 @@ def search_movie() -> None:
         messagebox.showwarning("Empty Input", "Please enter a movie name.")
         return
     
-    db = load_db()
-    
-    # Search local database
-    found = None
-    found_key = None
-    for key, v in db.items():
-        if v.get("title", "").lower() == name.lower():
-            found = v
-            found_key = key
-            break
+    found = find_movie(name) or _recall_scrape(name)
     
     if found:
         messagebox.showinfo(
             "Movie Found",
-            f"Found '{found['title']}' in database!"
+            f"Found '{found.title}' in database!"
         )
-        display_movie_details(found, found_key)
+        display_movie_details(found, found.title)
+        return
+    
+    # A near match may be a typo or a different film (e.g. a sequel), so ask
+    similar = find_similar_movie(name)
+    if similar and messagebox.askyesno(
+        "Did You Mean?",
+        f"'{name}' is not in the database.\n\nDid you mean '{similar.title}'?"
+    ):
+        display_movie_details(similar, similar.title)
     else:
-        # Search IMDb
-        movie_data, selected_title = scrape_imdb(name)
-        
-        if movie_data is None:
-            return
-        
-        # Save to database
-        db[selected_title] = movie_data
-        save_db(db)
-        
-        messagebox.showinfo(
-            "Movie Added",
-            f"Successfully added '{movie_data['title']}' to database!"
-        )
-        display_movie_details(movie_data, selected_title)
+        # Search IMDb in the background
+        scrape_imdb(name)
 
 
 # ============================================================================
@@ -473,7 +846,9 @@ def search_movie() -> None:
 
 def init_gui() -> None:
     """Initialize and run the Tkinter GUI."""
-    global root_window, entry
+    global root_window, entry, search_button
+    
+    init_db()
     
     root_window = tk.Tk()
     root_window.title("Movie Finder")
@@ -534,7 +909,7 @@ def init_gui() -> None:
     search_button.pack(pady=15)
     
     # Bind Enter key
-    entry.bind("<Return>", lambda event: search_movie())
+    set_search_enabled(True)
     
     root_window.mainloop()
 
@@ -0,0 +1,48 @@
+"""Tests for the trigram-based fuzzy title search."""
+
+import importlib.util
+import os
+
+import pytest
+
+pytest.importorskip("msgspec")
+
+MODULE_PATH = os.path.join(os.path.dirname(__file__), "..", "movie_finder (2).py")
+
+
+@pytest.fixture
+def movie_finder(tmp_path, monkeypatch):
+    """Load the app module against an empty database in a temp directory."""
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location("movie_finder", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.init_db()
+    for title in ("The Dark Knight", "Toy Story", "Inception"):
+        module.save_movie(module.Movie(title=title))
+    yield module
+    module._conn.close()
+
+
+def test_trigrams_ignore_case_and_leading_article(movie_finder):
+    assert movie_finder._trigrams("The Dark Knight") == movie_finder._trigrams("dark knight")
+    assert movie_finder._trigrams("An Education") == movie_finder._trigrams("education")
+
+
+def test_trigrams_keep_article_inside_title(movie_finder):
+    assert "the" in movie_finder._trigrams("Into the Wild")
+
+
+def test_find_similar_movie_matches_misspelling(movie_finder):
+    assert movie_finder.find_similar_movie("dark knite").title == "The Dark Knight"
+    assert movie_finder.find_similar_movie("incepton").title == "Inception"
+
+
+def test_find_similar_movie_returns_none_for_unrelated_query(movie_finder):
+    assert movie_finder.find_similar_movie("zzz") is None
+    assert movie_finder.find_similar_movie("casablanca") is None
+
+
+def test_find_similar_movie_indexes_newly_saved_titles(movie_finder):
+    movie_finder.save_movie(movie_finder.Movie(title="Zebra Crossing"))
+    assert movie_finder.find_similar_movie("zebra crosing").title == "Zebra Crossing"